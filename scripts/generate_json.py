@@ -2,6 +2,8 @@
 """
 Generate JSON files from Obsidian Markdown articles and books.
 Outputs data/articles.json and data/books.json for the blog.
+Parsed frontmatter is cached in <vault_path>/.fm_cache.json (kept out of the
+published output) so unchanged files are not re-parsed on the next run.
 
 Usage:
     python3 generate_json.py [OPTIONS] [vault_path] [output_path]
@@ -12,6 +14,10 @@ Usage:
 Options:
     -h, --help     Show this help message and exit
     --dry-run      Show what would be done without making changes
+    --compact      Write minified JSON instead of 2-space indented output
+
+Output is encoded with orjson when it is installed (optional), otherwise
+with the stdlib json module; both produce the same files.
 """
 
 import os
@@ -20,11 +26,38 @@ import json
 import sys
 import shutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 
 # Security constants
 MAX_IMAGE_SIZE = 50 * 1024 * 1024  # 50 MB per image
 MAX_FILE_SIZE = 10 * 1024 * 1024   # 10 MB per markdown file
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+
+# Markdown parsing is I/O-bound; threads overlap the small file reads.
+MAX_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Parsed-frontmatter cache, stored at the vault root (never in the published output).
+# Bump the version whenever parsing changes so stale entries are discarded.
+FM_CACHE_NAME = '.fm_cache.json'
+FM_CACHE_VERSION = 4
+
+# orjson is an optional speed-up for writing output (not in requirements.txt);
+# without it the stdlib json encoder produces the same files
+try:
+    import orjson
+    USE_ORJSON = True
+except ImportError:
+    USE_ORJSON = False
+
+# Quote characters that may wrap scalar values in the fallback parser
+QUOTES = "'\""
+
+# Fallback frontmatter parser states
+_FM_IDLE = 0       # no key waiting for a value
+_FM_KEY = 1        # saw `key:` with no inline value; `- item` lines attach here
+_FM_MULTILINE = 2  # collecting continuation lines for the open key
 
 # Try to use pyyaml if available, otherwise use simple parser
 try:
@@ -33,78 +66,230 @@ try:
 except ImportError:
     USE_YAML = False
 
+# Prefer the libyaml-backed loader; same safe semantics, much faster
+if USE_YAML:
+    try:
+        from yaml import CSafeLoader as _SafeLoader
+    except ImportError:
+        from yaml import SafeLoader as _SafeLoader
+
+def _unquote(value):
+    """Remove one pair of matching surrounding quotes, if present."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in QUOTES:
+        return value[1:-1]
+    return value
+
+def normalize_frontmatter(data):
+    """Normalize parsed frontmatter in place so `tags` is always a list.
+
+    A single string tag becomes a one-item list; anything else that is not a
+    list becomes empty. Non-mapping frontmatter is returned unchanged.
+    """
+    if isinstance(data, dict):
+        raw = data.get('tags')
+        if not isinstance(raw, list):
+            data['tags'] = [raw] if isinstance(raw, str) and raw else []
+    return data
+
 def parse_yaml_frontmatter(frontmatter_str):
+    """Parse YAML frontmatter and normalize it (see normalize_frontmatter)."""
+    return normalize_frontmatter(_load_frontmatter(frontmatter_str))
+
+def _load_frontmatter(frontmatter_str):
     """Parse YAML frontmatter - uses pyyaml if available, otherwise simple parser."""
     if USE_YAML:
         try:
-            return yaml.safe_load(frontmatter_str) or {}
+            return yaml.load(frontmatter_str, Loader=_SafeLoader) or {}
         except yaml.YAMLError:
             pass
     
-    # Fallback: Simple YAML parser (no external dependencies)
+    # Fallback: Simple YAML parser (no external dependencies), written as a
+    # small state machine over stripped lines. Slices of a stripped line only
+    # need their inner side trimmed.
     data = {}
+    data_setdefault = data.setdefault
     current_key = None
     current_value = []
-    in_list = False
+    current_value_append = current_value.append
+    state = _FM_IDLE
     
-    for line in frontmatter_str.split('\n'):
+    for line in frontmatter_str.splitlines():
         line = line.strip()
         if not line:
             continue
         
         # Handle list items
         if line.startswith('- '):
-            if current_key:
-                if current_key not in data:
-                    data[current_key] = []
-                # Remove quotes if present
-                value = line[2:].strip().strip("'\"")
-                data[current_key].append(value)
-            in_list = True
+            if state != _FM_IDLE:
+                data_setdefault(current_key, []).append(_unquote(line[2:].lstrip()))
             continue
-        elif in_list and not line.startswith('-'):
-            in_list = False
         
         # Handle key-value pairs
         if ':' in line:
-            if current_key and current_value:
-                data[current_key] = ' '.join(current_value).strip().strip("'\"")
-                current_value = []
+            if state == _FM_MULTILINE:
+                data[current_key] = _unquote(' '.join(current_value))
+                current_value.clear()
             
-            parts = line.split(':', 1)
-            current_key = parts[0].strip()
-            value = parts[1].strip() if len(parts) > 1 else ''
+            key, _, value = line.partition(':')
+            key = key.rstrip()
+            value = value.lstrip()
             
-            if value:
-                if value.startswith('[') and value.endswith(']'):
-                    # Array format: tags: ['Tech', 'Rails']
-                    value = value.strip('[]')
-                    data[current_key] = [v.strip().strip("'\"") for v in value.split(',') if v.strip()]
-                    current_key = None
-                else:
-                    data[current_key] = value.strip("'\"")
-                    current_key = None
+            if not value:
+                # An empty key never collects a value
+                current_key = key
+                state = _FM_KEY if key else _FM_IDLE
+            elif value[0] == '[' and value[-1] == ']':
+                # Array format: tags: ['Tech', 'Rails']
+                items = (v.strip() for v in value.strip('[]').split(','))
+                data[key] = [_unquote(v) for v in items if v]
+                state = _FM_IDLE
             else:
-                current_value = []
-        elif current_key:
-            current_value.append(line)
+                data[key] = _unquote(value)
+                state = _FM_IDLE
+        elif state != _FM_IDLE:
+            # Continuation line of a multi-line value
+            current_value_append(line)
+            state = _FM_MULTILINE
     
-    if current_key and current_value:
-        data[current_key] = ' '.join(current_value).strip().strip("'\"")
+    if state == _FM_MULTILINE:
+        data[current_key] = _unquote(' '.join(current_value))
     
     return data
 
-def extract_frontmatter(content):
-    """Extract YAML frontmatter from Markdown file."""
-    frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(frontmatter_pattern, content, re.DOTALL)
-    
-    if match:
-        frontmatter_str = match.group(1)
-        body = match.group(2)
-        frontmatter = parse_yaml_frontmatter(frontmatter_str)
-        return frontmatter, body
-    return {}, content
+def _scan_frontmatter(content):
+    """Locate the frontmatter block without copying anything.
+
+    The file must open with a `---` line; frontmatter ends at the next line
+    that is `---` (trailing whitespace allowed). Returns
+    (start, end, body_start) offsets into content, or None if there is no
+    frontmatter block.
+    """
+    first_nl = content.find('\n')
+    if first_nl < 0 or content[:first_nl].rstrip() != '---':
+        return None
+
+    start = first_nl + 1
+    end = content.find('\n---', start)
+    while end >= 0:
+        nl = content.find('\n', end + 4)
+        if nl < 0:
+            break
+        if not content[end + 4:nl].strip():
+            return start, end, nl + 1
+        end = content.find('\n---', end + 1)
+    return None
+
+def parse_frontmatter_only(content):
+    """Parse YAML frontmatter from Markdown without slicing out the body."""
+    bounds = _scan_frontmatter(content)
+    if bounds is None:
+        return normalize_frontmatter({})
+    start, end, _ = bounds
+    return parse_yaml_frontmatter(content[start:end])
+
+def _json_default(value):
+    """Serialize YAML-native values (dates, datetimes) as JSON strings."""
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+def load_frontmatter_cache(cache_path):
+    """Load the parsed-frontmatter cache, or an empty one if missing/stale."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != FM_CACHE_VERSION:
+        return {}
+    entries = data.get('entries')
+    return entries if isinstance(entries, dict) else {}
+
+def prune_frontmatter_cache(cache, paths):
+    """Drop cache entries for files that are no longer export candidates."""
+    keep = {str(path) for path in paths}
+    for key in [key for key in cache if key not in keep]:
+        del cache[key]
+
+def save_frontmatter_cache(cache_path, cache):
+    """Write the parsed-frontmatter cache atomically (tmp file + rename)."""
+    try:
+        payload = json.dumps({'version': FM_CACHE_VERSION, 'entries': cache},
+                             ensure_ascii=False, default=_json_default)
+        write_bytes_atomic(cache_path, payload.encode('utf-8'))
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not write frontmatter cache {cache_path}: {e}")
+
+def read_text_file(path):
+    """Read a small UTF-8 text file in one read and one decode.
+
+    Skips io.TextIOWrapper's incremental decoder; CRLF/CR newlines are then
+    normalized to LF so files parse the same as with read_text().
+    """
+    with open(path, 'rb', buffering=0) as f:
+        content = f.read().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+def iter_markdown_files(directory):
+    """Yield (path, stat) for each readable *.md file directly in directory.
+
+    Uses one os.scandir pass; DirEntry caches its stat result, so the size
+    check below is the only stat per file. Oversized files are skipped with a
+    warning, and a missing or unreadable directory yields nothing.
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.name.endswith('.md'):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+                if st.st_size > MAX_FILE_SIZE:
+                    print(f"Warning: Skipping large file {entry.name} ({st.st_size / 1024 / 1024:.1f} MB)")
+                    continue
+                yield Path(entry.path), st
+    except OSError:
+        return
+
+def read_markdown(md_file, st, cache=None):
+    """Return (frontmatter, get_body) for md_file, reusing the cache when unchanged.
+
+    `st` is the stat result already taken for the size check; a cached
+    frontmatter entry is only reused when both mtime_ns and size still match.
+    Freshly parsed frontmatter goes through the same JSON round trip as cached
+    frontmatter, so callers see the same value types either way. Only the
+    frontmatter is cached: get_body() reads the file when the body is needed,
+    so files rejected on their frontmatter alone are never read on a hit.
+    """
+    key = str(md_file)
+    entry = cache.get(key) if cache is not None else None
+    content = None
+    if (isinstance(entry, dict)
+            and entry.get('mtime_ns') == st.st_mtime_ns
+            and entry.get('size') == st.st_size):
+        frontmatter = entry['frontmatter']
+    else:
+        content = read_text_file(md_file)
+        frontmatter = json.loads(json.dumps(parse_frontmatter_only(content), default=_json_default))
+        if cache is not None:
+            cache[key] = {
+                'mtime_ns': st.st_mtime_ns,
+                'size': st.st_size,
+                'frontmatter': frontmatter,
+            }
+
+    def get_body():
+        text = content if content is not None else read_text_file(md_file)
+        bounds = _scan_frontmatter(text)
+        return text[bounds[2]:] if bounds else text
+
+    return frontmatter, get_body
 
 def extract_section(body, section_name):
     """Extract content of a markdown section by heading name."""
@@ -213,9 +398,136 @@ def enrich_article_book_links(articles, books):
 
     return articles
 
-def get_articles(vault_root=None):
-    """Collect all published articles from blog/ozzo/articles/YYYY/published/ folders."""
-    articles = []
+def _process_article(md_file, st, cache=None):
+    """Build the articles.json entry for one Markdown file, or None if excluded."""
+    try:
+        frontmatter, get_body = read_markdown(md_file, st, cache)
+        get = frontmatter.get
+
+        # Folder is the publish gate: any file under .../published/ is export-eligible.
+        # `status` is optional for published items, but explicit draft is always excluded.
+        if str(get('status', '')).strip().lower() == 'draft':
+            return None
+
+        if str(get('blog', '')).strip().lower() == 'synergym':
+            return None
+
+        slug = get('slug', '') or md_file.stem
+        raw_thumbnail = get('thumbnail', '')
+        article_url = get('url', '')
+        # The body is only needed for internal articles (slug, no external URL).
+        article_body = get_body().strip() if slug and not article_url else ''
+
+        # Internal article contract: slug + content, external URL optional.
+        # If URL is empty but we have slug+content, mark as internal.
+        is_internal = bool(slug and article_body and not article_url)
+
+        # Support dynamic thumbnail templates in frontmatter.
+        # Examples:
+        #   thumbnail: "https://picsum.photos/seed/{slug}/1200/630"
+        #   thumbnail: "https://.../{{slug}}/..."
+        # If thumbnail is missing, auto-generate from slug.
+        thumbnail = raw_thumbnail
+        if isinstance(raw_thumbnail, str) and raw_thumbnail:
+            thumbnail = raw_thumbnail.replace('{slug}', slug).replace('{{slug}}', slug)
+        elif slug:
+            thumbnail = f"https://picsum.photos/seed/{slug}/1200/630"
+        else:
+            thumbnail = ''
+
+        # Optional citation list. Each entry is a markdown link,
+        # wikilink, or plain string: "[Label](url)", "[[wikilink]]",
+        # and bare text all work, with bare text kept whole.
+        raw_references = get('references')
+        references = []
+        if isinstance(raw_references, list):
+            references = [
+                parse_article_citation_reference(entry)
+                for entry in raw_references
+                if isinstance(entry, str)
+            ]
+
+        article = {
+            'title': get('title', ''),
+            'date': normalize_json_value(get('date', '')),
+            'description': get('description', ''),
+            'url': article_url,
+            'thumbnail': thumbnail,
+            'tags': frontmatter['tags'],
+            'book': get('book', ''),
+            'book_url': '',
+            'references': references,
+        }
+
+        if is_internal:
+            article['source'] = 'internal'
+            article['slug'] = slug
+            article['content'] = article_body
+
+        return article
+    except Exception as e:
+        print(f"Error processing {md_file}: {e}")
+        return None
+
+def _process_book(md_file, st, cache=None):
+    """Build the books.json entry for one Markdown file, or None if excluded."""
+    try:
+        frontmatter, get_body = read_markdown(md_file, st, cache)
+        get = frontmatter.get
+
+        # Only include if status is read (or if rating exists)
+        rating = get('rating', 0)
+        if not (get('status') == 'read' or rating):
+            return None
+
+        # Convert rating to float if it's a string
+        try:
+            rating = float(rating) if rating else 0
+        except (ValueError, TypeError):
+            rating = 0
+
+        body = get_body()
+
+        # Extract lesson from ## Key Lesson section; fall back to frontmatter field
+        lesson = extract_section(body, 'Key Lesson') or get('lesson', '')
+
+        # Extract notes from ## Notes section (skip placeholder comments)
+        # Only include if source is not "external"
+        notes = ''
+        if get('source', 'internal') != 'external':
+            notes = extract_section(body, 'Notes')
+
+        book = {
+            'title': get('title', ''),
+            'author': get('author', ''),
+            'cover': get('cover', ''),
+            'rating': rating,
+            'slug': get('slug', ''),
+            'url': get('url', ''),
+            'tags': frontmatter['tags'],
+            'lesson': lesson,
+            'notes': notes,
+        }
+        return book
+    except Exception as e:
+        print(f"Error processing {md_file}: {e}")
+        return None
+
+def _map_files(jobs, cache=None):
+    """Run process(path, stat, cache) for each (process, path, stat) job on a
+    thread pool and return the results in job order."""
+    if not jobs:
+        return []
+    def run(job):
+        process, md_file, st = job
+        return process(md_file, st, cache)
+
+    workers = min(MAX_WORKERS, len(jobs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run, jobs))
+
+def _article_candidates(vault_root=None):
+    """Return (path, stat) for each Markdown file in blog/ozzo/articles/YYYY/published/."""
     if vault_root:
         articles_dir = Path(vault_root) / 'blog/ozzo/articles'
     else:
@@ -223,111 +535,22 @@ def get_articles(vault_root=None):
     
     if not articles_dir.exists():
         print(f"Warning: Articles directory not found at {articles_dir}")
-        return articles
+        return []
     
     if not articles_dir.is_dir():
         print(f"Warning: Articles path exists but is not a directory: {articles_dir}")
-        return articles
+        return []
     
-    # Find all published articles
-    for year_dir in articles_dir.iterdir():
-        if not year_dir.is_dir():
-            continue
-        
-        published_dir = year_dir / 'published'
-        if not published_dir.exists():
-            continue
-        
-        for md_file in published_dir.glob('*.md'):
-            try:
-                # Check file size before reading
-                try:
-                    file_size = md_file.stat().st_size
-                    if file_size > MAX_FILE_SIZE:
-                        print(f"Warning: Skipping large file {md_file.name} ({file_size / 1024 / 1024:.1f} MB)")
-                        continue
-                except OSError:
-                    continue
-                
-                content = md_file.read_text(encoding='utf-8')
-                frontmatter, body = extract_frontmatter(content)
-                
-                # Folder is the publish gate: any file under .../published/ is export-eligible.
-                # `status` is optional for published items, but explicit draft is always excluded.
-                if str(frontmatter.get('status', '')).strip().lower() == 'draft':
-                    continue
+    with os.scandir(articles_dir) as years:
+        year_dirs = [entry.path for entry in years if entry.is_dir()]
 
-                if str(frontmatter.get('blog', '')).strip().lower() == 'synergym':
-                    continue
+    candidates = []
+    for year_dir in year_dirs:
+        candidates.extend(iter_markdown_files(os.path.join(year_dir, 'published')))
+    return candidates
 
-                slug = frontmatter.get('slug', '') or md_file.stem
-                raw_thumbnail = frontmatter.get('thumbnail', '')
-                article_url = frontmatter.get('url', '')
-                article_body = body.strip() if isinstance(body, str) else ''
-
-                # Internal article contract: slug + content, external URL optional.
-                # If URL is empty but we have slug+content, mark as internal.
-                is_internal = bool(slug and article_body and not article_url)
-
-                # Support dynamic thumbnail templates in frontmatter.
-                # Examples:
-                #   thumbnail: "https://picsum.photos/seed/{slug}/1200/630"
-                #   thumbnail: "https://.../{{slug}}/..."
-                # If thumbnail is missing, auto-generate from slug.
-                thumbnail = raw_thumbnail
-                if isinstance(raw_thumbnail, str) and raw_thumbnail:
-                    thumbnail = raw_thumbnail.replace('{slug}', slug).replace('{{slug}}', slug)
-                elif slug:
-                    thumbnail = f"https://picsum.photos/seed/{slug}/1200/630"
-                else:
-                    thumbnail = ''
-
-                # Optional citation list. Each entry is a markdown link,
-                # wikilink, or plain string: "[Label](url)", "[[wikilink]]",
-                # and bare text all work, with bare text kept whole.
-                raw_references = frontmatter.get('references')
-                references = []
-                if isinstance(raw_references, list):
-                    references = [
-                        parse_article_citation_reference(entry)
-                        for entry in raw_references
-                        if isinstance(entry, str)
-                    ]
-
-                article = {
-                    'title': frontmatter.get('title', ''),
-                    'date': normalize_json_value(frontmatter.get('date', '')),
-                    'description': frontmatter.get('description', ''),
-                    'url': article_url,
-                    'thumbnail': thumbnail,
-                    'tags': frontmatter.get('tags', []) if isinstance(frontmatter.get('tags'), list) else [],
-                    'book': frontmatter.get('book', ''),
-                    'book_url': '',
-                    'references': references,
-                }
-
-                if is_internal:
-                    article['source'] = 'internal'
-                    article['slug'] = slug
-                    article['content'] = article_body
-
-                articles.append(article)
-            except Exception as e:
-                print(f"Error processing {md_file}: {e}")
-                continue
-    
-    # Sort by date (newest first) and normalize date types (str/date/datetime)
-    def _sortable_date(value):
-        if hasattr(value, 'isoformat'):
-            return value.isoformat()
-        return str(value or '')
-
-    articles.sort(key=lambda x: _sortable_date(x.get('date', '')), reverse=True)
-    return articles
-
-def get_books(vault_root=None):
-    """Collect all books from blog/books/ folder."""
-    books = []
+def _book_candidates(vault_root=None):
+    """Return (path, stat) for each Markdown file in blog/books/."""
     if vault_root:
         books_dir = Path(vault_root) / 'blog/books'
     else:
@@ -335,65 +558,58 @@ def get_books(vault_root=None):
     
     if not books_dir.exists():
         print(f"Warning: Books directory not found at {books_dir}")
-        return books
+        return []
     
     if not books_dir.is_dir():
         print(f"Warning: Books path exists but is not a directory: {books_dir}")
-        return books
+        return []
     
-    # Find all book files
-    for md_file in books_dir.glob('*.md'):
-        try:
-            # Check file size before reading
-            try:
-                file_size = md_file.stat().st_size
-                if file_size > MAX_FILE_SIZE:
-                    print(f"Warning: Skipping large file {md_file.name} ({file_size / 1024 / 1024:.1f} MB)")
-                    continue
-            except OSError:
-                continue
-            
-            content = md_file.read_text(encoding='utf-8')
-            frontmatter, body = extract_frontmatter(content)
-            
-            # Only include if status is read (or if rating exists)
-            if frontmatter.get('status') == 'read' or frontmatter.get('rating'):
-                # Convert rating to float if it's a string
-                rating = frontmatter.get('rating', 0)
-                try:
-                    rating = float(rating) if rating else 0
-                except (ValueError, TypeError):
-                    rating = 0
-
-                # Extract lesson from ## Key Lesson section; fall back to frontmatter field
-                lesson = extract_section(body, 'Key Lesson') or frontmatter.get('lesson', '')
-
-                # Extract notes from ## Notes section (skip placeholder comments)
-                # Only include if source is not "external"
-                notes = ''
-                if frontmatter.get('source', 'internal') != 'external':
-                    notes = extract_section(body, 'Notes')
-
-                book = {
-                    'title': frontmatter.get('title', ''),
-                    'author': frontmatter.get('author', ''),
-                    'cover': frontmatter.get('cover', ''),
-                    'rating': rating,
-                    'slug': frontmatter.get('slug', ''),
-                    'url': frontmatter.get('url', ''),
-                    'tags': frontmatter.get('tags', []) if isinstance(frontmatter.get('tags'), list) else [],
-                    'lesson': lesson,
-                    'notes': notes,
-                }
-                books.append(book)
-        except Exception as e:
-            print(f"Error processing {md_file}: {e}")
-            continue
-    
-    # Sort by rating (highest first), then by title
-    books.sort(key=lambda x: (float(x.get('rating', 0)), x.get('title', '')), reverse=True)
+    return list(iter_markdown_files(books_dir))
+
+def _sort_articles(articles):
+    """Sort by date (newest first) and normalize date types (str/date/datetime)."""
+    def _sortable_date(value):
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return str(value or '')
+
+    articles.sort(key=lambda x: _sortable_date(x.get('date', '')), reverse=True)
+    return articles
+
+def _sort_books(books):
+    """Sort by rating (highest first), then by title."""
+    # Every book entry carries a numeric `rating` and a `title` (see _process_book)
+    books.sort(key=itemgetter('rating', 'title'), reverse=True)
     return books
 
+def _collect_content(article_files, book_files, cache=None):
+    """Parse article and book (path, stat) candidates on one shared thread pool.
+
+    Returns (articles, books), each with excluded files dropped and sorted.
+    """
+    jobs = [(_process_article, md_file, st) for md_file, st in article_files]
+    jobs.extend((_process_book, md_file, st) for md_file, st in book_files)
+
+    results = _map_files(jobs, cache)
+    split = len(article_files)
+    articles = [article for article in results[:split] if article]
+    books = [book for book in results[split:] if book]
+    return _sort_articles(articles), _sort_books(books)
+
+def collect_vault_content(vault_root=None, cache=None):
+    """Collect articles and books from the vault.
+
+    The articles and books directories are scanned separately; their files
+    are then parsed together on one thread pool. Cache entries for files that
+    are no longer candidates are dropped. Returns (articles, books).
+    """
+    article_files = _article_candidates(vault_root)
+    book_files = _book_candidates(vault_root)
+    if cache is not None:
+        prune_frontmatter_cache(cache, (md_file for md_file, _ in article_files + book_files))
+
+    return _collect_content(article_files, book_files, cache)
+
 def sanitize_filename(filename):
     """Sanitize filename to prevent path traversal and invalid characters."""
     # Remove path components
@@ -455,47 +671,101 @@ def copy_images(vault_root=None, output_dir='data', dry_run=False):
     # Copy all images with security checks
     copied = 0
     skipped = 0
-    for image_file in images_source.glob('*'):
-        if not image_file.is_file():
-            continue
-            
-        # Check file extension
-        if image_file.suffix.lower() not in ['.jpg', '.jpeg', '.png', '.gif', '.webp']:
-            continue
-        
-        # Check file size
-        try:
-            file_size = image_file.stat().st_size
-            if file_size > MAX_IMAGE_SIZE:
-                print(f"Warning: Skipping large image {image_file.name} ({file_size / 1024 / 1024:.1f} MB > {MAX_IMAGE_SIZE / 1024 / 1024} MB)")
-                skipped += 1
+    unchanged = 0
+    with os.scandir(images_source) as it:
+        for entry in it:
+            if not entry.is_file():
                 continue
-        except OSError as e:
-            print(f"Warning: Cannot read file {image_file.name}: {e}")
-            skipped += 1
-            continue
-        
-        # Sanitize filename
-        safe_name = sanitize_filename(image_file.name)
-        dest_file = images_dest / safe_name
-        
-        if dry_run:
-            print(f"[DRY RUN] Would copy: {image_file.name} -> {dest_file}")
-        else:
+
+            # Check file extension (a leading dot alone is a hidden file, not an extension)
+            name = entry.name
+            dot = name.rfind('.')
+            if dot <= 0 or name[dot:].lower() not in IMAGE_EXTENSIONS:
+                continue
+
+            # Check file size (DirEntry caches the stat result)
             try:
-                shutil.copy2(image_file, dest_file)
-                copied += 1
-            except (OSError, shutil.Error) as e:
-                print(f"Error copying {image_file.name}: {e}")
+                src = entry.stat()
+                file_size = src.st_size
+                if file_size > MAX_IMAGE_SIZE:
+                    print(f"Warning: Skipping large image {entry.name} ({file_size / 1024 / 1024:.1f} MB > {MAX_IMAGE_SIZE / 1024 / 1024} MB)")
+                    skipped += 1
+                    continue
+            except OSError as e:
+                print(f"Warning: Cannot read file {entry.name}: {e}")
                 skipped += 1
+                continue
+
+            # Sanitize filename
+            safe_name = sanitize_filename(entry.name)
+            dest_file = images_dest / safe_name
+
+            # Skip images already copied: same size and not older than the source
+            try:
+                dst = dest_file.stat()
+                if dst.st_size == file_size and dst.st_mtime_ns >= src.st_mtime_ns:
+                    unchanged += 1
+                    continue
+            except OSError:
+                pass
+
+            if dry_run:
+                print(f"[DRY RUN] Would copy: {entry.name} -> {dest_file}")
+            else:
+                try:
+                    shutil.copyfile(entry.path, dest_file)
+                    copied += 1
+                except (OSError, shutil.Error) as e:
+                    print(f"Error copying {entry.name}: {e}")
+                    skipped += 1
     
     if not dry_run and copied > 0:
         print(f"Copied {copied} images to {images_dest}/")
+    if unchanged > 0:
+        print(f"{unchanged} images already up to date in {images_dest}/")
     if skipped > 0:
         print(f"Skipped {skipped} images")
     
     return copied
 
+def write_bytes_atomic(path, payload):
+    """Write payload to path via a sibling tmp file and os.replace.
+
+    Readers only ever see the old or the new file, never a truncated one.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def write_json(path, data, compact=False):
+    """Write data as UTF-8 JSON, 2-space indented unless compact.
+
+    The document is encoded in memory and written atomically in one write.
+    Both encoders treat non-JSON values alike: non-str keys become strings
+    and anything else goes through _json_default.
+    """
+    if USE_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(data, option=option, default=_json_default)
+    elif compact:
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'),
+                             default=_json_default).encode('utf-8')
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=2,
+                             default=_json_default).encode('utf-8')
+    write_bytes_atomic(path, payload)
+
 def main():
     """Generate JSON files."""
     parser = argparse.ArgumentParser(
@@ -519,6 +789,8 @@ Examples:
                        help='Path to output directory (default: ./data)')
     parser.add_argument('--dry-run', action='store_true',
                        help='Show what would be done without making changes')
+    parser.add_argument('--compact', action='store_true',
+                       help='Write minified JSON instead of 2-space indented output')
     
     args = parser.parse_args()
     
@@ -562,18 +834,23 @@ Examples:
         print("DRY RUN MODE: No files will be modified")
     print()
     
+    # Unchanged Markdown files are served from the cache instead of being re-parsed.
+    cache_path = Path(vault_root or '.') / FM_CACHE_NAME
+    fm_cache = load_frontmatter_cache(cache_path)
+
     # Copy images first
     copy_images(vault_root, output_dir, dry_run=args.dry_run)
 
     # Collect content before writing so article references can be enriched with book URLs.
-    articles = get_articles(vault_root)
-    books = get_books(vault_root)
+    articles, books = collect_vault_content(vault_root, fm_cache)
     articles = enrich_article_book_links(articles, books)
 
+    if not args.dry_run:
+        save_frontmatter_cache(cache_path, fm_cache)
+
     # Generate articles.json
     if not args.dry_run:
-        with open(articles_path, 'w', encoding='utf-8') as f:
-            json.dump(articles, f, ensure_ascii=False, indent=2)
+        write_json(articles_path, articles, compact=args.compact)
         print(f"\nGenerated {articles_path} with {len(articles)} articles")
     else:
         print(f"\n[DRY RUN] Would generate {articles_path} with {len(articles)} articles")
@@ -583,8 +860,7 @@ Examples:
 
     # Generate books.json
     if not args.dry_run:
-        with open(books_path, 'w', encoding='utf-8') as f:
-            json.dump(books, f, ensure_ascii=False, indent=2)
+        write_json(books_path, books, compact=args.compact)
         print(f"\nGenerated {books_path} with {len(books)} books")
     else:
         print(f"\n[DRY RUN] Would generate {books_path} with {len(books)} books")